@@ -86,7 +86,7 @@ with tqdm(total=args.frames) as pbar:
     while counts < args.frames:
         selected = random.random() < args.epsilon #and same_object_list(env.objects, env.objects_v)
         if selected:
-            state = deepcopy(torch.tensor(env.get_rgb_state))
+            state = torch.tensor(env.get_rgb_state)
             dqn_state = deepcopy(env.dqn_obs[0])
             objects = deepcopy(env.objects)
             
@@ -238,6 +238,7 @@ class HumanPlayable(HackAtari):
         self.paused = False
         self.current_keys_down = set()
         self.keys2actions = self.env.unwrapped.get_keys_to_action()
+        self._action = 0  # NOOP
 
 
 
@@ -261,13 +262,14 @@ class HumanPlayable(HackAtari):
         '''
         _get_action: Gets the action corresponding to the current key press.
         '''
-        pressed_keys = list(self.current_keys_down)
-        pressed_keys.sort()
-        pressed_keys = tuple(pressed_keys)
-        if pressed_keys in self.keys2actions.keys():
-            return self.keys2actions[pressed_keys]
-        else:
-            return 0  # NOOP
+        return self._action
+
+    def _update_action(self):
+        '''
+        _update_action: Recomputes the action after the set of pressed keys changed.
+        '''
+        pressed_keys = tuple(sorted(self.current_keys_down))
+        self._action = self.keys2actions.get(pressed_keys, 0)  # NOOP
 
     def _handle_user_input(self):
         '''
@@ -292,7 +294,9 @@ class HumanPlayable(HackAtari):
 
                 elif (event.key,) in self.keys2actions.keys():  # Env action
                     self.current_keys_down.add(event.key)
+                    self._update_action()
 
             elif event.type == pygame.KEYUP:  # Keyboard key released
                 if (event.key,) in self.keys2actions.keys():
                     self.current_keys_down.remove(event.key)
+                    self._update_action()
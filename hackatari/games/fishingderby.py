@@ -1,70 +1,80 @@
-FISH_MODE = 0 # Give the fishes an area to swim in (Int: 0-3)
-SHARK_MODE = 0 # Give the shark an area to swim in (Int: 0-4)
+def shark_no_movement_easy(self):
+    '''
+    shark_no_movement_easy: Fixes the shark directly below the enemy player (shark mode 1)
+    '''
+    self.set_ram(75, 105)
+
+def shark_no_movement_hard(self):
+    '''
+    shark_no_movement_hard: Fixes the shark directly below the player (shark mode 2)
+    '''
+    self.set_ram(75, 25)
+
+def shark_teleport(self):
+    '''
+    shark_teleport: Teleports the shark to the other side of the lake
+    when it reaches an edge (shark mode 3)
+    '''
+    current_x_position = self.get_ram()[75]
+    if current_x_position == 100:
+        self.set_ram(75, 25)
+    elif current_x_position == 30:
+        self.set_ram(75, 105)
 
-def alter_shark(self):
+def shark_speed(self):
     '''
-    alter_shark: Allows for alterations in the behavior of the shark as specified
-    by the corresponding command line option
+    shark_speed: Makes the shark swim faster (shark mode 4)
     '''
-    # shark modes
-    if SHARK_MODE > 0:
-        # shark mode: no movement easy
-        if SHARK_MODE == 1:
-            self.set_ram(75, 105)
-        # shark mode: no movement hard
-        if SHARK_MODE == 2:
-            self.set_ram(75, 25)
-        # shark mode: teleport
-        if SHARK_MODE == 3:
-            current_x_position = self.get_ram()[75]
-            if current_x_position == 100:
-                self.set_ram(75, 25)
-            if current_x_position == 30:
-                self.set_ram(75, 105)
-        # shark mode: speed mode
-        if SHARK_MODE == 4:
-            current_x_position = self.get_ram()[75]
-            if current_x_position < 120:
-                self.set_ram(75, current_x_position+5)
-            if current_x_position > 120:
-                self.set_ram(75, 1)
+    current_x_position = self.get_ram()[75]
+    if current_x_position < 120:
+        self.set_ram(75, current_x_position+5)
+    elif current_x_position > 120:
+        self.set_ram(75, 1)
+
+# step modification for each shark mode, mode 0 leaves the shark untouched
+_SHARK_MODES = (None, shark_no_movement_easy, shark_no_movement_hard, shark_teleport, shark_speed)
 
-def alter_fish(self):
+def fish_player_side(self):
     '''
-    alter_fishes: Allows for alterations in the behavior of the fish as specified
-    by the corresponding command line option
+    fish_player_side: Moves all fish to the player's side (fish mode 1)
     '''
-    # fish modes
-    if FISH_MODE > 0:
-        # fish mode 1: fish are all on player's side
-        if FISH_MODE == 1:
-            for i in range(6):
-                if self.get_ram()[69+i] > 86:
-                    self.set_ram(69+i, 44)
-        # # fish mode 2: fish are all on enemy's side
-        # if FISH_MODE == 2:
-        #     for i in range(6):
-        #         if self.get_ram()[69+i] < 70:
-        #             self.set_ram(69+i, 116)
-        # fish mode 3: fish are always in the middle between player and enemy
-        if FISH_MODE == 3:
-            for i in range(6):
-                if self.get_ram()[112] != i+1 or self.get_ram()[113] != i+1:
-                    if self.get_ram()[69+i] < 70:
-                        self.set_ram(69+i, 86)
-                    if self.get_ram()[69+i] > 86:
-                        self.set_ram(69+i, 70)
+    ram = self.get_ram()
+    for i in range(6):
+        if ram[69+i] > 86:
+            self.set_ram(69+i, 44)
+
+# # fish mode 2: fish are all on enemy's side
+# def fish_enemy_side(self):
+#     for i in range(6):
+#         if self.get_ram()[69+i] < 70:
+#             self.set_ram(69+i, 116)
+
+def fish_middle(self):
+    '''
+    fish_middle: Keeps the fish in the middle between player and enemy (fish mode 3)
+    '''
+    ram = self.get_ram()
+    for i in range(6):
+        if ram[112] != i+1 or ram[113] != i+1:
+            if ram[69+i] < 70:
+                self.set_ram(69+i, 86)
+            elif ram[69+i] > 86:
+                self.set_ram(69+i, 70)
+
+# step modification for each fish mode, modes 0 and 2 leave the fish untouched
+_FISH_MODES = (None, fish_player_side, None, fish_middle)
 
 def _modif_funcs(env, modifs):
     
     for mod in modifs:
         mod_n = int(mod[-1])
         if mod.startswith('f'):
-            global FISH_MODE
-            FISH_MODE = mod_n
-            env.step_modifs.append(alter_fish)
+            if mod_n < 0 or mod_n >= len(_FISH_MODES):
+                raise ValueError("Invalid Fish Mode, choose number 0-3")
+            if _FISH_MODES[mod_n] is not None:
+                env.step_modifs.append(_FISH_MODES[mod_n])
         elif mod.startswith('s'):
-            global SHARK_MODE
-            SHARK_MODE = mod_n
-            env.step_modifs.append(alter_shark)
-    
\ No newline at end of file
+            if mod_n < 0 or mod_n >= len(_SHARK_MODES):
+                raise ValueError("Invalid Shark Mode, choose number 0-4")
+            if _SHARK_MODES[mod_n] is not None:
+                env.step_modifs.append(_SHARK_MODES[mod_n])
@@ -1,13 +1,7 @@
 from random import randint, choice
 
 # Global Variables
-TOGGLE_ORANGE = 0
-TOGGLE_CYAN = 0
-TOGGLE_PINK = 0
-TOGGLE_RED = 0
 NUMBER_POWER_PILLS = 4
-LAST_PP_STATUS = 4
-IS_INVERTED = False
 LVL_NUM = 0
 LIVES = 2
 
@@ -15,6 +9,16 @@ TIMER = 1
 
 DOT_STATES = [59, 60, 61, 62, 65, 66, 67, 71, 72, 73, 83, 89, 90, 91, 92, 95, 98, 99, 100]
 
+# RAM writes making the orange, cyan, pink and red ghost edible: the ghost status
+# is set to 130 and the ghost is moved to its start location to avoid glitches
+_EDIBLE_WRITES = (((1, 130), (6, 120), (12, 50)),
+                  ((2, 130), (7, 100), (13, 50)),
+                  ((3, 130), (8, 80), (14, 50)),
+                  ((4, 130), (9, 60), (15, 50)))
+
+# Values of the RAM cells 62, 95 and 117 for 0, 1, 2 and 3 power pills
+_PP_TABLE = ((80, 80, 0), (64, 80, 8), (0, 80, 40), (0, 64, 46))
+
 # Each line has the same pattern, to get the states and values for the other lines, simply add line number * 3 (counting from 0) to the first value of the tupel.
 # For the first line its 59+(0*3), for the second line its 59+(1*3), for the third its 59+(2*3)... so state + ((n-1) * 3)
 DOT_PATTERN = [(59, 64), (60, 128), (60, 32), (60, 8), (60, 2), (61, 1), (61, 4), (61, 16), (61, 64),
@@ -37,76 +41,65 @@ GRID1 = [
         [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1]
     ]
 
-def make_edible(env, ghost_number,  x_pos, ram_x, y_pos, ram_y):
-    ''' A helper function to make a certain ghost edible.
-    The position is changed as well to avoid glitches.
-    ghost_number: integer between 1 and 4 to choose between the 4 ghosts
-    ram_x: integer which defines the ram cell in which the x-position is saved
-    x_pos: integer which defines the new x-position of the ghost
-    ram_y: integer which defines the ram cell in which the y-position is saved
-    y_pos: integer which defines the new y-position of the ghost
+def set_ram_many(env, pairs):
+    ''' A helper function to write a list of RAM cells one after another,
+    so fixed write sequences can be kept as data. It only adds a call,
+    so it is meant for reset and power pill transitions, not per-frame code.
+    pairs: iterable of (ram_cell, value) tuples
     '''
-    env.set_ram(ghost_number, 130)
-    env.set_ram(ram_x, x_pos)
-    env.set_ram(ram_y, y_pos)
+    set_ram = env.set_ram
+    for addr, value in pairs:
+        set_ram(addr, value)
 
 
 def set_start_condition(self):
     ''' A helper function to set the start condition at the beginning of 
     each level/ after a reset'''
     # set the ghost to "edible" and change start location to avoid glitches
-    # orange ghost
-    make_edible(self, 1, 120, 6, 50, 12)
-    # cyan ghost
-    make_edible(self, 2, 100, 7, 50, 13)
-    # pink ghost
-    make_edible(self, 3, 80, 8, 50, 14)
-    # red ghost
-    make_edible(self, 4, 60 ,9, 50, 15)
-    # set the timer to max number
-    self.set_ram(116, 255)
+    # (orange, cyan, pink, red) and set the timer to max number
+    set_ram_many(self, (*_EDIBLE_WRITES[0], *_EDIBLE_WRITES[1],
+                        *_EDIBLE_WRITES[2], *_EDIBLE_WRITES[3], (116, 255)))
 
 
 def inverted_power_pill(self):
     ''' A helper function to make the ghost "normal" again.
     They will be able to eat Ms. Pacman for a certain amount of time.'''
-    i = 1
-    while i < 5:
-        # make ghosts "normal"
-        self.set_ram(i, 0)
-        i += 1
-    # set timer    
-    self.set_ram(116, 62)
+    # make ghosts "normal" and set timer
+    set_ram_many(self, ((1, 0), (2, 0), (3, 0), (4, 0), (116, 62)))
 
 
 def power_pill_is_done(self):
     ''' A helper function to make all ghosts edible again.'''
-    i = 1
-    while i < 5:
-        # make ghosts edible
-        self.set_ram(i, 130)
-        i += 1
-    # set timer   
-    self.set_ram(116, 190)
-
-
-def static_ghosts(self):
-    '''
-    static_ghosts: Manipulates the RAM cell at position 6-9 and 12-15 to fix the position of
-    the ghost inside the square in the middle of the screen.
-    '''
-    if TOGGLE_ORANGE:
-        self.set_ram(6, 93)
-        self.set_ram(12, 80)
-    if TOGGLE_CYAN:
-        self.set_ram(7, 83)
-        self.set_ram(13, 80)
-    if TOGGLE_PINK:
-        self.set_ram(8, 93)
-        self.set_ram(14, 67)
-    if TOGGLE_RED:
-        self.set_ram(9, 83)
-        self.set_ram(15, 67)
+    # make ghosts edible and set timer
+    set_ram_many(self, ((1, 130), (2, 130), (3, 130), (4, 130), (116, 190)))
+
+
+def _make_static_ghosts(mask):
+    ''' A helper function to build the static_ghosts variant for a mask of
+    caged ghosts (bit 0: orange, bit 1: cyan, bit 2: pink, bit 3: red).'''
+    orange, cyan, pink, red = mask & 1, mask & 2, mask & 4, mask & 8
+
+    def static_ghosts(self):
+        '''
+        static_ghosts: Manipulates the RAM cell at position 6-9 and 12-15 to fix the position of
+        the ghost inside the square in the middle of the screen.
+        '''
+        if orange:
+            self.set_ram(6, 93)
+            self.set_ram(12, 80)
+        if cyan:
+            self.set_ram(7, 83)
+            self.set_ram(13, 80)
+        if pink:
+            self.set_ram(8, 93)
+            self.set_ram(14, 67)
+        if red:
+            self.set_ram(9, 83)
+            self.set_ram(15, 67)
+    return static_ghosts
+
+
+_STATIC_VARIANTS = tuple(_make_static_ghosts(mask) for mask in range(16))
 
 
 def number_power_pills(self):
@@ -118,22 +111,9 @@ def number_power_pills(self):
     current_lives: an integer used to store the current number of lives of Ms. Pacman
     '''
 
-    if NUMBER_POWER_PILLS == 0: # no power pills
-        self.set_ram(62, 80)
-        self.set_ram(95, 80)
-        self.set_ram(117, 0)
-    elif NUMBER_POWER_PILLS == 1: # 1 power pill
-        self.set_ram(62, 64)
-        self.set_ram(95, 80)
-        self.set_ram(117, 8)
-    elif NUMBER_POWER_PILLS == 2: # two power pills
-        self.set_ram(62, 0)
-        self.set_ram(95, 80)
-        self.set_ram(117, 40)
-    elif NUMBER_POWER_PILLS == 3: # three power pills
-        self.set_ram(62, 0)
-        self.set_ram(95, 64)
-        self.set_ram(117, 46)
+    if NUMBER_POWER_PILLS < len(_PP_TABLE): # 4 power pills is the default game
+        v62, v95, v117 = _PP_TABLE[NUMBER_POWER_PILLS]
+        set_ram_many(self, ((62, v62), (95, v95), (117, v117)))
 
 
 def edible_ghosts(self):
@@ -152,13 +132,8 @@ def edible_ghosts(self):
     current_pink: an integer used to store the current status of the pink ghost
     current_red: an integer used to store the current status of the red ghost
     '''
-    current_timer = self.get_ram()[116]
-
-    current_orange = self.get_ram()[1]
-    current_cyan = self.get_ram()[2]
-    current_pink = self.get_ram()[3]
-    current_red = self.get_ram()[4]
-
+    ram = self.get_ram()
+    current_timer = ram[116]
 
     # check if timer needs to be adjusted
     if current_timer < 250:
@@ -166,21 +141,25 @@ def edible_ghosts(self):
 
     # check if a ghost has been eaten and if needed make them edible again
     # change start location to avoid glitches
+    current_orange, current_cyan, current_pink, current_red = ram[1:5].tolist()
     if current_orange == 112:
-        make_edible(self, 1, 120, 6, 50, 12)
+        for addr, value in _EDIBLE_WRITES[0]:
+            self.set_ram(addr, value)
     if current_cyan == 112:
-        make_edible(self, 2, 100, 7, 50, 13)
+        for addr, value in _EDIBLE_WRITES[1]:
+            self.set_ram(addr, value)
     if current_pink == 112:
-        make_edible(self, 3, 80, 8, 50, 14)
+        for addr, value in _EDIBLE_WRITES[2]:
+            self.set_ram(addr, value)
     if current_red == 112 or current_red == 0:
-        make_edible(self, 4, 60 ,9, 50, 15)
+        for addr, value in _EDIBLE_WRITES[3]:
+            self.set_ram(addr, value)
 
 
 def inverted_ms_pacman_reset(self):
     set_start_condition(self)
-    global LAST_PP_STATUS, IS_INVERTED
-    LAST_PP_STATUS = 63
-    IS_INVERTED = False
+    self._last_pp_status = 63
+    self._is_inverted = False
 
 
 def inverted_ms_pacman(self):
@@ -201,41 +180,43 @@ def inverted_ms_pacman(self):
     current_pink: an integer used to store the current status of the pink ghost
     current_red: an integer used to store the current status of the red ghost
     '''
-    global LAST_PP_STATUS, IS_INVERTED
-    current_pp_status = self.get_ram()[117]
-    current_timer = self.get_ram()[116]
-
-    current_orange = self.get_ram()[1]
-    current_cyan = self.get_ram()[2]
-    current_pink = self.get_ram()[3]
-    current_red = self.get_ram()[4]
-    
+    ram = self.get_ram()
+    current_pp_status = int(ram[117])
+    current_timer = ram[116]
+    current_orange, current_cyan, current_pink, current_red = ram[1:5].tolist()
+
     # check if timer needs to be adjusted
-    if current_timer < 250 and IS_INVERTED is False:
+    if current_timer < 250 and self._is_inverted is False:
         self.set_ram(116, 255)
 
     # check if a power pill has been eaten
     # a range is required because the values in the RAm cells fluctuate
-    if not((LAST_PP_STATUS - 3) < current_pp_status < (LAST_PP_STATUS + 3)):
-        IS_INVERTED = True
+    # (compared as ints, uint8 arithmetic would wrap for statuses near 0 and 255)
+    if abs(current_pp_status - self._last_pp_status) >= 3:
+        self._is_inverted = True
         inverted_power_pill(self)
-        LAST_PP_STATUS = current_pp_status
+        self._last_pp_status = current_pp_status
 
     # check if effect of power pill has run out
     if current_timer == 0:
-        IS_INVERTED = False # disable switch
+        self._is_inverted = False # disable switch
         power_pill_is_done(self)
 
     # check if a ghost has been eaten and if needed make them edible again
     # change start location to avoid glitches
-    if current_orange == 112 and not IS_INVERTED:
-        make_edible(self, 1, 120, 6, 50, 12)
-    if current_cyan == 112 and not IS_INVERTED:
-        make_edible(self, 2, 100, 7, 50, 13)
-    if current_pink == 112 and not IS_INVERTED:
-        make_edible(self, 3, 80, 8, 50, 14)
-    if current_red == 112 and not IS_INVERTED:
-        make_edible(self, 4, 60 ,9, 50, 15)
+    if not self._is_inverted:
+        if current_orange == 112:
+            for addr, value in _EDIBLE_WRITES[0]:
+                self.set_ram(addr, value)
+        if current_cyan == 112:
+            for addr, value in _EDIBLE_WRITES[1]:
+                self.set_ram(addr, value)
+        if current_pink == 112:
+            for addr, value in _EDIBLE_WRITES[2]:
+                self.set_ram(addr, value)
+        if current_red == 112:
+            for addr, value in _EDIBLE_WRITES[3]:
+                self.set_ram(addr, value)
 
 def change_level(self):
     """
@@ -371,30 +352,61 @@ def maze_man_reset(self):
     self.set_ram(123, LIVES)
 
 
+def _setup_edible_ghosts(env):
+    env.step_modifs.append(edible_ghosts)
+
+
+def _setup_inverted(env):
+    env._last_pp_status = 4
+    env._is_inverted = False
+    env.step_modifs.append(inverted_ms_pacman)
+    env.reset_modifs.append(inverted_ms_pacman_reset)
+
+
+def _setup_end_game(env):
+    env.reset_modifs.append(end_game)
+
+
+def _setup_maze_man(env):
+    env.reset_modifs.append(change_level)
+    env.step_modifs.append(maze_man)
+    env.reset_modifs.append(maze_man_reset)
+
+
+# ghosts caged by each modification (bit 0: orange, bit 1: cyan, bit 2: pink, bit 3: red)
+_CAGE_BITS = {
+    "caged_ghosts": 0b1111,
+    "disable_orange": 0b0001,
+    "disable_cyan": 0b0010,
+    "disable_pink": 0b0100,
+    "disable_red": 0b1000,
+    "maze_man": 0b1111,
+}
+
+# setup function for each modification that is selected by its exact name
+_MODIF_SETUPS = {
+    "edible_ghosts": _setup_edible_ghosts,
+    "inverted": _setup_inverted,
+    "end_game": _setup_end_game,
+    "maze_man": _setup_maze_man,
+}
+
+
 def _modif_funcs(env, modifs):
-    global TOGGLE_CYAN, TOGGLE_PINK, TOGGLE_ORANGE, TOGGLE_RED
-    
     if "edible_ghosts" in modifs and "inverted" in modifs:
         raise ValueError("The modification \"ghosts_edible\" is unnecessary when playing in inverted mode")
+    mask = 0
+    for mod in modifs:
+        mask |= _CAGE_BITS.get(mod, 0)
+    caged = False
     for mod in modifs:
-        if mod == "caged_ghosts":
-            TOGGLE_CYAN = True
-            TOGGLE_ORANGE = True 
-            TOGGLE_RED = True
-            TOGGLE_PINK = True
-            env.step_modifs.append(static_ghosts)
-        elif mod == "disable_orange":
-            TOGGLE_ORANGE = True
-            env.step_modifs.append(static_ghosts)
-        elif mod == "disable_red":
-            TOGGLE_RED = True
-            env.step_modifs.append(static_ghosts)
-        elif mod == "disable_cyan":
-            TOGGLE_CYAN = True
-            env.step_modifs.append(static_ghosts)
-        elif mod == "disable_pink":
-            TOGGLE_PINK = True
-            env.step_modifs.append(static_ghosts)
+        # register static_ghosts once, at the first modification caging a ghost
+        if mod in _CAGE_BITS and not caged:
+            env.step_modifs.append(_STATIC_VARIANTS[mask])
+            caged = True
+        setup = _MODIF_SETUPS.get(mod)
+        if setup is not None:
+            setup(env)
         elif mod.startswith("power"):
             mod_n = int(mod[-1])
             if mod_n < 0 or mod_n > 4:
@@ -402,26 +414,9 @@ def _modif_funcs(env, modifs):
             global NUMBER_POWER_PILLS
             NUMBER_POWER_PILLS = mod_n
             env.reset_modifs.append(number_power_pills)
-        elif mod == "edible_ghosts":
-            env.step_modifs.append(edible_ghosts)
-        elif mod == "inverted":
-            env.step_modifs.append(inverted_ms_pacman)
-            env.reset_modifs.append(inverted_ms_pacman_reset)
         elif "change_level" in mod:
             if mod[-1].isdigit():
                 global LVL_NUM
-                LVL_NUM =  int(mod[-1])
+                LVL_NUM = int(mod[-1])
                 assert LVL_NUM < 4, "Invalid Level Number (0, 1, 2 or 3)"
             env.reset_modifs.append(change_level)
-        elif mod == "end_game":
-            env.reset_modifs.append(end_game)
-        elif mod == "maze_man":
-            env.reset_modifs.append(change_level)
-            TOGGLE_CYAN = True
-            TOGGLE_ORANGE = True 
-            TOGGLE_RED = True
-            TOGGLE_PINK = True
-            env.step_modifs.append(static_ghosts)
-            env.step_modifs.append(maze_man)
-            env.reset_modifs.append(maze_man_reset)
-    
\ No newline at end of file
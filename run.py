@@ -52,6 +52,8 @@ if __name__ == "__main__":
                         help="Use an alternative ALE game mode")
     parser.add_argument('-d','--difficulty', type=int, default=0, 
                         help="Use an alternative ALE difficulty for the game.")
+    parser.add_argument('-nr','--no_render', action='store_true',
+                        help="Run headless, without rendering (and frame pacing) of each step.")
 
 
 
@@ -64,7 +66,8 @@ if __name__ == "__main__":
         env = HumanPlayable(args.game, args.modifs, args.switch_modifs, args.switch_frame, args.reward_function, args.color_swaps, args.game_mode, args.difficulty)
         env.run()
     else:        
-        env = HackAtari(args.game, args.modifs, args.switch_modifs, args.switch_frame, args.reward_function, color_swaps, args.game_mode, args.difficulty, render_mode="human", obs_mode="dqn")
+        render_mode = "rgb_array" if args.no_render else "human"
+        env = HackAtari(args.game, args.modifs, args.switch_modifs, args.switch_frame, args.reward_function, color_swaps, args.game_mode, args.difficulty, render_mode=render_mode, obs_mode="dqn")
         pygame.init()
         if args.agent:
             agent = load_agent(args.agent, env.action_space.n)
@@ -97,6 +100,7 @@ if __name__ == "__main__":
             # if nstep % 100 == 0:
             #     print(".", end="", flush=True)
             nstep += 1
-            env.render()
+            if not args.no_render:
+                env.render()
             
         env.close()